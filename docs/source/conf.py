@@ -15,7 +15,11 @@ from pathlib import Path
 import sys
 
 from dunamai import Version
-from setuptools import config
+
+if sys.version_info >= (3, 8):
+    from importlib import metadata as importlib_metadata
+else:
+    import importlib_metadata
 
 
 def repository_root(path: PathLike = None) -> Path:
@@ -25,19 +29,19 @@ def repository_root(path: PathLike = None) -> Path:
         path = Path(path)
     if path.is_file():
         path = path.parent
-    if '.git' in (child.name for child in path.iterdir()) or path == path.parent:
-        return path
-    else:
-        return repository_root(path.parent)
+    # check for `.git` directly at each level, instead of listing every directory on the way up
+    while not (path / '.git').exists() and path != path.parent:
+        path = path.parent
+    return path
 
 
 sys.path.insert(0, str(repository_root()))
 
 # -- Project information -----------------------------------------------------
-metadata = config.read_configuration('../../setup.cfg')['metadata']
+metadata = importlib_metadata.metadata('nemspy')
 
-project = metadata['name']
-author = metadata['author']
+project = metadata['Name']
+author = metadata['Author']
 copyright = f'2021, Office of Coast Survey (OCS), National Oceanic and Atmospheric Administration (NOAA)'
 
 # The full version, including alpha/beta/rc tags
@@ -1,13 +1,12 @@
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
-from enum import Enum
+from functools import lru_cache
 import logging
 import os
 from os import PathLike
 from pathlib import Path
 import sys
-from textwrap import indent
-from typing import Iterator, List, Tuple, Union
+from typing import Iterator, List, TextIO, Tuple, Union
 
 if sys.version_info >= (3, 8):
     from importlib import metadata as importlib_metadata
@@ -29,6 +28,10 @@ from nemspy.model.base import (
 )
 from nemspy.utilities import create_symlink
 
+RUN_SEQUENCE_TEMPLATE = (
+    'runSeq::\n' f'{INDENTATION}@{{interval:.0f}}\n' '{entries}\n' f'{INDENTATION}@\n' '::'
+)
+
 
 class Earth(AttributeEntry):
     """
@@ -51,11 +54,12 @@ class Earth(AttributeEntry):
         if 'Verbosity' not in models:
             models['Verbosity'] = VerbosityOption.OFF
 
-        self.__models = {model_type: None for model_type in EntryType}
+        self.__models = dict.fromkeys(EntryType)
 
+        model_types = {model_type.name for model_type in EntryType}
         attributes = {}
         for key, value in models.items():
-            if key.upper() in {entry.name for entry in EntryType}:
+            if key.upper() in model_types:
                 if isinstance(value, ModelEntry):
                     self[EntryType[key.upper()]] = value
             else:
@@ -77,7 +81,7 @@ class Earth(AttributeEntry):
         assert model_type == model.entry_type
         if self.__models[model_type] is not None:
             logging.debug(
-                f'overwriting existing "{model_type.name}" model: ' f'{repr(self[model_type])}'
+                'overwriting existing "%s" model: %r', model_type.name, self[model_type]
             )
         self.__models[model_type] = model
 
@@ -89,19 +93,21 @@ class Earth(AttributeEntry):
             yield model_type, model
 
     def __str__(self) -> str:
-        attributes = [
-            f'{attribute} = {value if not isinstance(value, Enum) else value.value}'
+        component_list = ' '.join(
+            model_type.value
+            for model_type, model in self.__models.items()
+            if model is not None
+        )
+        # enumerations are already converted to their values by the ``attributes`` property
+        attributes = '\n'.join(
+            f'{INDENTATION}{attribute} = {value}'
             for attribute, value in self.attributes.items()
-        ]
-
-        return '\n'.join(
-            [
-                f'{self.entry_title}_component_list: '
-                f'{" ".join(model_type.value for model_type, model in self.models.items() if model is not None)}',
-                f'{self.entry_title}_attributes::',
-                indent('\n'.join(attributes), INDENTATION),
-                '::',
-            ]
+        )
+        return (
+            f'{self.entry_title}_component_list: {component_list}\n'
+            f'{self.entry_title}_attributes::\n'
+            f'{attributes}\n'
+            '::'
         )
 
     def __repr__(self) -> str:
@@ -134,9 +140,9 @@ class RunSequence(AttributeEntry, SequenceEntry):
             kwargs['Verbosity'] = VerbosityOption.OFF
 
         self.__models = {}
+        model_types = {model_type.value for model_type in EntryType}
         attributes = {}
         for key, value in kwargs.items():
-            model_types = [model_type.value for model_type in EntryType]
             if key.upper() in model_types and isinstance(value, ModelEntry):
                 self.__models[EntryType(key.upper())] = value
             else:
@@ -326,7 +332,7 @@ class RunSequence(AttributeEntry, SequenceEntry):
         if model_type in self.__models:
             existing_model = self.__models[model_type]
             logging.debug(
-                f'overwriting {model_type.name} model ' f'"{existing_model}" with "{model}"'
+                'overwriting %s model "%s" with "%s"', model_type.name, existing_model, model
             )
             self.__sequence.remove(self.__sequence.index(existing_model))
         self.__models[model_type] = model
@@ -341,13 +347,14 @@ class RunSequence(AttributeEntry, SequenceEntry):
         list of models in the run sequence
         """
 
-        models = [
+        # the mediator, if any, always leads the list of models
+        mediator = self.__models.get(EntryType.MEDIATOR)
+        models = [] if mediator is None else [mediator]
+        models.extend(
             model
             for model_type, model in self.__models.items()
-            if model_type in self and model_type is not EntryType.MEDIATOR
-        ]
-        if self.mediator is not None:
-            models.insert(0, self.mediator)
+            if model_type is not EntryType.MEDIATOR
+        )
         return models
 
     def __iter__(self) -> Iterator[ModelEntry]:
@@ -365,16 +372,17 @@ class RunSequence(AttributeEntry, SequenceEntry):
         return str(self)
 
     def __str__(self) -> str:
-        block = '\n'.join(
-            [
-                f'@{self.interval / timedelta(seconds=1):.0f}',
-                indent(
-                    '\n'.join(entry.sequence_entry for entry in self.__sequence), INDENTATION
-                ),
-                '@',
-            ]
+        # indent every line of the sequence entries once,
+        # under both the ``runSeq`` block and the time loop
+        entry_indentation = INDENTATION * 2
+        entries = '\n'.join(
+            f'{entry_indentation}{line}' if line.strip() else line
+            for entry in self.__sequence
+            for line in entry.sequence_entry.split('\n')
+        )
+        return RUN_SEQUENCE_TEMPLATE.format(
+            interval=self.interval / timedelta(seconds=1), entries=entries
         )
-        return '\n'.join([f'runSeq::', indent(block, INDENTATION), '::'])
 
     def __repr__(self) -> str:
         models = [f'{model.entry_type.name.lower()}={repr(model)}' for model in self.models]
@@ -404,49 +412,48 @@ class ConfigurationFile(ABC):
         comment header indicating filename and NEMSpy version
         """
 
-        installed_distributions = importlib_metadata.distributions()
-        for distribution in installed_distributions:
-            if (
-                distribution.metadata['Name'] is not None
-                and distribution.metadata['Name'].lower() == 'nemspy'
-            ):
-                version = distribution.version
-                break
-        else:
-            version = 'unknown'
-        return f'# `{self.name}` generated with NEMSpy {version}'
+        return f'# `{self.name}` generated with NEMSpy {installed_version()}'
 
     def write(
-        self, filename: PathLike, overwrite: bool = False, include_version: bool = False
-    ) -> Path:
+        self,
+        filename: Union[PathLike, TextIO],
+        overwrite: bool = False,
+        include_version: bool = False,
+    ) -> Union[Path, TextIO]:
         """
         write this configuration to file
 
-        :param filename: path to file
+        :param filename: path to file, or an open file-like object to write to directly
         :param overwrite: overwrite an existing file
         :param include_version: include NEMSpy version information
-        :returns: path to written file
+        :returns: path to written file, or the given file-like object
         """
 
-        if not isinstance(filename, Path):
-            filename = Path(filename)
-        ensure_directory(filename.parent)
-
         output = f'{self}\n'
         if include_version:
             output = f'{self.version_header}\n' f'{output}'
 
+        if hasattr(filename, 'write'):
+            filename.write(output)
+            return filename
+
+        if not isinstance(filename, Path):
+            filename = Path(filename)
+        ensure_directory(filename.parent)
+
         if filename.is_dir():
             filename = filename / self.name
-            logging.debug(
-                f'creating new file "{os.path.relpath(filename.resolve(), Path.cwd())}"'
-            )
+            if logging.root.isEnabledFor(logging.DEBUG):
+                logging.debug(
+                    f'creating new file "{os.path.relpath(filename.resolve(), Path.cwd())}"'
+                )
 
-        if filename.exists():
+        exists = filename.exists()
+        if exists and logging.root.isEnabledFor(logging.DEBUG):
             logging.debug(
                 f'{"overwriting" if overwrite else "skipping"} existing file "{os.path.relpath(filename.resolve(), Path.cwd())}"'
             )
-        if not filename.exists() or overwrite:
+        if not exists or overwrite:
             with open(filename, 'w', newline='\n') as output_file:
                 output_file.write(output)
 
@@ -537,10 +544,13 @@ class ModelConfigurationFile(ConfigurationFile):
         super().__init__(sequence)
 
     def write(
-        self, filename: PathLike, overwrite: bool = False, include_version: bool = False,
-    ) -> Path:
+        self,
+        filename: Union[PathLike, TextIO],
+        overwrite: bool = False,
+        include_version: bool = False,
+    ) -> Union[Path, TextIO]:
         filename = super().write(filename, overwrite, include_version)
-        if self.create_atm_namelist_rc:
+        if self.create_atm_namelist_rc and isinstance(filename, Path):
             create_symlink(filename, filename.parent / 'atm_namelist.rc', relative=True)
         return filename
 
@@ -590,3 +600,20 @@ def ensure_directory(directory: PathLike) -> Path:
     if not directory.exists():
         directory.mkdir(parents=True, exist_ok=True)
     return directory
+
+
+@lru_cache(maxsize=None)
+def installed_version() -> str:
+    """
+    look up the installed version of NEMSpy once, instead of scanning every installed distribution on each write
+
+    :returns: version string, or ``unknown`` if NEMSpy is not installed
+    """
+
+    for distribution in importlib_metadata.distributions():
+        if (
+            distribution.metadata['Name'] is not None
+            and distribution.metadata['Name'].lower() == 'nemspy'
+        ):
+            return distribution.version
+    return 'unknown'
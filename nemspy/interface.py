@@ -21,6 +21,10 @@ from nemspy.model.base import (
     ModelEntry,
 )
 
+# lookup tables from user-supplied names to enumeration members
+MODEL_TYPES = {model_type.value.upper(): model_type for model_type in EntryType}
+REMAP_METHODS = {remap.value.lower(): remap for remap in GridRemapMethod}
+
 
 class ModelingSystem:
     """
@@ -74,21 +78,21 @@ class ModelingSystem:
         :param med: model mediator
         """
 
+        self.__files = None
+
         self.__start_time = start_time
         self.end_time = end_time
 
-        model_types = [model_type.value.lower() for model_type in EntryType]
-
         parsed_models = {}
         attributes = {}
         for key, value in models.items():
-            if key.lower() in model_types:
-                key = key.lower()
+            model_type = MODEL_TYPES.get(key.upper())
+            if model_type is not None:
                 if isinstance(value, ModelEntry):
-                    if value.entry_type.value.lower() == key:
-                        parsed_models[key.upper()] = value
+                    if value.entry_type is model_type:
+                        parsed_models[model_type.value] = value
                     else:
-                        raise TypeError(f'"{value.name}" is not {key}')
+                        raise TypeError(f'"{value.name}" is not {key.lower()}')
                 else:
                     raise TypeError(f'unsupported type {value.__class__}"')
             else:
@@ -107,8 +111,10 @@ class ModelingSystem:
 
     @start_time.setter
     def start_time(self, start_time: datetime):
-        start_time = typepigeon.convert_value(start_time, datetime)
+        if not isinstance(start_time, datetime):
+            start_time = typepigeon.convert_value(start_time, datetime)
         self.__start_time = start_time
+        self.__files = None
         if self.start_time > self.end_time:
             self.start_time = self.end_time
             self.end_time = start_time
@@ -123,8 +129,10 @@ class ModelingSystem:
 
     @end_time.setter
     def end_time(self, end_time: datetime):
-        end_time = typepigeon.convert_value(end_time, datetime)
+        if not isinstance(end_time, datetime):
+            end_time = typepigeon.convert_value(end_time, datetime)
         self.__end_time = end_time
+        self.__files = None
         if self.end_time < self.start_time:
             self.end_time = self.start_time
             self.start_time = end_time
@@ -255,21 +263,18 @@ class ModelingSystem:
             except:
                 pass
 
-        model_types = [model_type.value.upper() for model_type in EntryType]
-        remap_methods = [remap.value.lower() for remap in GridRemapMethod]
-
-        if source.upper() not in model_types:
-            raise KeyError(f'"{source}" not in {model_types}')
+        if source.upper() not in MODEL_TYPES:
+            raise KeyError(f'"{source}" not in {list(MODEL_TYPES)}')
         if target is not None:
-            if target.upper() not in model_types:
-                raise KeyError(f'"{target}" not in {model_types}')
-            target = EntryType(target.upper())
+            if target.upper() not in MODEL_TYPES:
+                raise KeyError(f'"{target}" not in {list(MODEL_TYPES)}')
+            target = MODEL_TYPES[target.upper()]
         if method is not None:
-            if method.lower() not in remap_methods:
-                raise KeyError(f'"{method}" not in {remap_methods}')
-            method = GridRemapMethod(method.lower())
+            if method.lower() not in REMAP_METHODS:
+                raise KeyError(f'"{method}" not in {list(REMAP_METHODS)}')
+            method = REMAP_METHODS[method.lower()]
 
-        self.__sequence.connect(EntryType(source.upper()), target, method)
+        self.__sequence.connect(MODEL_TYPES[source.upper()], target, method)
 
     @property
     def connections(self) -> List[str]:
@@ -301,43 +306,44 @@ class ModelingSystem:
 
         if targets is None:
             try:
-                targets = MediationEntry.from_string(sources).targets
+                targets = list(MediationEntry.from_string(sources).targets)
             except:
                 pass
 
-        model_types = [model_type.value.upper() for model_type in EntryType]
-        remap_methods = [remap.value.lower() for remap in GridRemapMethod]
-
         if sources is not None:
             if isinstance(sources, str):
                 sources = [sources]
             for index, source in enumerate(sources):
                 if isinstance(source, str):
-                    if source.upper() not in model_types:
-                        raise KeyError(f'"{source}" not in {model_types}')
-                    sources[index] = EntryType(source.upper())
+                    if source.upper() not in MODEL_TYPES:
+                        raise KeyError(f'"{source}" not in {list(MODEL_TYPES)}')
+                    sources[index] = MODEL_TYPES[source.upper()]
         if targets is not None:
             if isinstance(targets, str):
                 targets = [targets]
             for index, target in enumerate(targets):
                 if isinstance(target, str):
-                    if target.upper() not in model_types:
-                        raise KeyError(f'"{target}" not in {model_types}')
-                    targets[index] = EntryType(target.upper())
+                    if target.upper() not in MODEL_TYPES:
+                        raise KeyError(f'"{target}" not in {list(MODEL_TYPES)}')
+                    targets[index] = MODEL_TYPES[target.upper()]
         if method is not None and isinstance(method, str):
-            if method.lower() not in remap_methods:
-                raise KeyError(f'"{method}" not in {remap_methods}')
-            method = GridRemapMethod(method.lower())
+            if method.lower() not in REMAP_METHODS:
+                raise KeyError(f'"{method}" not in {list(REMAP_METHODS)}')
+            method = REMAP_METHODS[method.lower()]
 
         self.__sequence.mediate(sources, functions, targets, method, processors, **attributes)
 
     @property
     def __configuration_files(self) -> List[ConfigurationFile]:
-        return [
-            NEMSConfigurationFile(self.__sequence),
-            FileForcingsFile(self.__sequence),
-            ModelConfigurationFile(self.start_time, self.duration, self.__sequence),
-        ]
+        # the files render the run sequence on demand,
+        # but ``model_configure`` captures the start time and duration
+        if self.__files is None:
+            self.__files = [
+                NEMSConfigurationFile(self.__sequence),
+                FileForcingsFile(self.__sequence),
+                ModelConfigurationFile(self.start_time, self.duration, self.__sequence),
+            ]
+        return self.__files
 
     @property
     def configuration(self) -> Dict[str, str]:
@@ -374,27 +380,29 @@ class ModelingSystem:
             raise ValueError(
                 f'model type must be {str} or {EntryType}, not {type(model_type)}'
             )
-        model_types = [model_type.value.upper() for model_type in EntryType]
-        if model_type.upper() not in model_types:
-            raise KeyError(f'"{model_type}" not in {model_types}')
-        return self.__sequence[EntryType(model_type.upper())]
+        if model_type.upper() not in MODEL_TYPES:
+            raise KeyError(f'"{model_type}" not in {list(MODEL_TYPES)}')
+        return self.__sequence[MODEL_TYPES[model_type.upper()]]
 
     def __setitem__(self, model_type: str, model: ModelEntry):
         if not isinstance(model_type, str) and not isinstance(model_type, EntryType):
             raise ValueError(
                 f'model type must be {str} or {EntryType}, not {type(model_type)}'
             )
-        model_types = [model_type.value.upper() for model_type in EntryType]
-        if model_type.upper() not in model_types:
-            raise KeyError(f'"{model_type}" not in {model_types}')
-        self.__sequence[EntryType(model_type.upper())] = model
+        if model_type.upper() not in MODEL_TYPES:
+            raise KeyError(f'"{model_type}" not in {list(MODEL_TYPES)}')
+        self.__sequence[MODEL_TYPES[model_type.upper()]] = model
 
     def __contains__(self, model_type: str) -> bool:
         if not isinstance(model_type, str) and not isinstance(model_type, EntryType):
             raise ValueError(
                 f'model type must be {str} or {EntryType}, not {type(model_type)}'
             )
-        return EntryType(model_type.upper()) in self.__sequence
+        if isinstance(model_type, str):
+            model_type = MODEL_TYPES.get(model_type.upper())
+            if model_type is None:
+                return False
+        return model_type in self.__sequence
 
     def __repr__(self) -> str:
         models = [f'{model.entry_type}={repr(model)}' for model in self.__sequence.models]
@@ -10,9 +10,6 @@ class AtmosphericModelEntry(ModelEntry):
 
     entry_type = EntryType.ATMOSPHERIC
 
-    def __init__(self, processors: int, **kwargs):
-        super().__init__(processors, **kwargs)
-
 
 class AtmosphericForcingEntry(AtmosphericModelEntry, FileForcingEntry):
     """
@@ -37,6 +34,3 @@ class HWRFEntry(AtmosphericModelEntry):
     """
 
     name = 'hwrf'
-
-    def __init__(self, processors: int, **kwargs):
-        super().__init__(processors, **kwargs)
@@ -1,12 +1,26 @@
 from abc import ABC, abstractmethod
 from enum import Enum
+from functools import lru_cache
 from os import PathLike
 from pathlib import PurePosixPath
-from textwrap import indent
-from typing import Dict, List
+import re
+from typing import Dict, List, Tuple
 
 INDENTATION = '  '
 
+MODEL_ENTRY_TEMPLATE = (
+    '{type}_model:                      {name}\n'
+    '{type}_petlist_bounds:             {start} {end}\n'
+    '{type}_attributes::\n'
+    '{attributes}\n'
+    '::'
+)
+
+CONNECTION_ENTRY_TEMPLATE = '{connection:<13}:remapMethod={method}'
+
+# `SRC -> DST   :remapMethod=METHOD`, where the remapping method is optional
+CONNECTION_PATTERN = re.compile(r'^\s*(\w+)\s*->\s*(\w+)\s*(?::\s*remapMethod=(\w*))?\s*$')
+
 
 class EntryType(Enum):
     """
@@ -50,33 +64,48 @@ class FileForcingEntry(ABC):
     abstraction of a forcing entry in ``config.rc``, defining the file path to a forcing file
     """
 
+    __slots__ = ()
+
     def __init__(self, entry_type: EntryType, filename: PathLike = None):
         """
         :param entry_type: type of file forcing (i.e. ``ATM``, ``ICE``, etc.)
         :param filename: path to file
         """
 
+        self.mesh_type = entry_type
+        self.filename = filename
+
+    @property
+    def filename(self) -> PurePosixPath:
+        """
+        path to forcing file
+        """
+
+        return self.__filename
+
+    @filename.setter
+    def filename(self, filename: PathLike):
         if filename is not None and not isinstance(filename, PurePosixPath):
             filename = PurePosixPath(filename)
 
-        self.mesh_type = entry_type
-        self.filename = filename
+        self.__filename = filename
+
+        # split the path once here rather than on every write of ``config.rc``
+        if filename is not None:
+            self.__directory = filename.parent.as_posix()
+            self.__name = filename.name
+        else:
+            self.__directory = ''
+            self.__name = ''
 
     def __str__(self) -> str:
         """
         string representation of the forcing entry in ``config.rc``
         """
 
-        if self.filename is not None:
-            directory = self.filename.parent.as_posix()
-            name = self.filename.name
-        else:
-            directory = ''
-            name = ''
-
         return (
-            f' {self.mesh_type.value.lower()}_dir: {directory}\n'
-            f' {self.mesh_type.value.lower()}_nam: {name}'
+            f' {self.mesh_type.value.lower()}_dir: {self.__directory}\n'
+            f' {self.mesh_type.value.lower()}_nam: {self.__name}'
         )
 
 
@@ -85,6 +114,8 @@ class ConfigurationEntry(ABC):
     abstraction of an entry in a configuration file
     """
 
+    __slots__ = ()
+
     @classmethod
     @abstractmethod
     def from_string(cls, string: str, **kwargs) -> 'ConfigurationEntry':
@@ -108,6 +139,8 @@ class AttributeEntry(ABC):
     abstraction of a configuration entry in ``nems.configure``
     """
 
+    __slots__ = ()
+
     entry_title: str = NotImplementedError
     __attributes: Dict[str, str] = NotImplementedError
 
@@ -144,6 +177,8 @@ class SequenceEntry(ABC):
     abstraction of an entry within the run sequence in ``nems.configure``
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def sequence_entry(self) -> str:
@@ -157,11 +192,56 @@ class SequenceEntry(ABC):
         return self.sequence_entry
 
 
+@lru_cache(maxsize=128)
+def parse_model_entry(string: str) -> Tuple[EntryType, str, int, Tuple[Tuple[str, str], ...]]:
+    """
+    parse the entry type, name, number of processors, and attributes from a model entry in ``nems.configure``
+
+    results are cached, since the same entry is often parsed repeatedly
+    """
+
+    lines = string.splitlines()
+
+    parsed_model_type, _, parsed_name = lines[0].partition('_model:')
+    parsed_model_type = EntryType(parsed_model_type.strip())
+
+    start_processor, end_processor = (
+        int(entry) for entry in lines[1].partition('_petlist_bounds:')[2].split()
+    )
+
+    attributes = []
+    for attribute_line in lines[3:-1]:
+        key, separator, value = attribute_line.partition('=')
+        if len(separator) == 0:
+            raise ValueError(f'attribute line has no value: "{attribute_line}"')
+        attributes.append((key.strip(), value.strip()))
+
+    return (
+        parsed_model_type,
+        parsed_name.strip(),
+        end_processor + 1 - start_processor,
+        tuple(attributes),
+    )
+
+
 class ModelEntry(AttributeEntry, SequenceEntry, ConfigurationEntry):
     """
     abstraction of a generic model implementing NEMS / NUOPC coupling
     """
 
+    # ``entry_type`` and ``name`` are class attributes of the subclasses, and are overridden in
+    # the instance ``__dict__`` of generic entries, e.g. in ``ConnectionEntry.from_string``
+    __slots__ = (
+        '__dict__',
+        '_AttributeEntry__attributes',
+        '_processors',
+        '_start_processor',
+        '_previous',
+        '_next',
+        '_string',
+        '_string_key',
+    )
+
     entry_type: EntryType
     name: str
 
@@ -173,12 +253,14 @@ class ModelEntry(AttributeEntry, SequenceEntry, ConfigurationEntry):
         :param processors: number of processors to assign to this model
         """
 
-        self.__processors = processors
+        self._processors = processors
+
+        self._start_processor = None
 
-        self.__start_processor = None
+        self._previous = None
+        self._next = None
 
-        self.__previous = None
-        self.__next = None
+        self._string = None
 
         if 'Verbosity' not in attributes:
             attributes['Verbosity'] = VerbosityOption.OFF
@@ -188,30 +270,21 @@ class ModelEntry(AttributeEntry, SequenceEntry, ConfigurationEntry):
 
     @classmethod
     def from_string(cls, string: str, **kwargs) -> 'ModelEntry':
-        lines = string.splitlines()
+        parsed_model_type, parsed_name, processors, attributes = parse_model_entry(string)
 
-        parsed_model_type, parsed_name = (value.strip() for value in lines[0].split('_model:'))
-        parsed_model_type = EntryType(parsed_model_type)
+        has_entry_type = hasattr(cls, 'entry_type')
+        has_name = hasattr(cls, 'name')
 
-        if hasattr(cls, 'model_type'):
+        if has_entry_type:
             assert parsed_model_type == cls.entry_type
-        if hasattr(cls, 'name'):
+        if has_name:
             assert parsed_name == cls.name
 
-        start_processor, end_processor = [
-            int(entry) for entry in lines[1].split('_petlist_bounds:')[-1].strip().split()
-        ]
-
-        attributes = {}
-        for attribute_line in lines[3:-1]:
-            key, value = (value.strip() for value in attribute_line.split('='))
-            attributes[key] = value
-
-        instance = cls(processors=end_processor + 1 - start_processor, **attributes)
+        instance = cls(processors=processors, **dict(attributes))
 
-        if not hasattr(cls, 'model_type'):
+        if not has_entry_type:
             instance.entry_type = parsed_model_type
-        if not hasattr(cls, 'name'):
+        if not has_name:
             instance.name = parsed_name
 
         return instance
@@ -219,6 +292,13 @@ class ModelEntry(AttributeEntry, SequenceEntry, ConfigurationEntry):
     def __copy__(self) -> 'ModelEntry':
         return self.__class__(processors=self.processors, **self.attributes)
 
+    @AttributeEntry.attributes.setter
+    def attributes(self, attributes: Dict[str, str]):
+        # store a copy, so that later changes to the given dictionary cannot leave the cached
+        # string stale
+        AttributeEntry.attributes.fset(self, dict(attributes))
+        self._string = None
+
     @property
     def entry_title(self) -> str:
         return str(self.entry_type.value) if self.entry_type is not None else None
@@ -229,7 +309,7 @@ class ModelEntry(AttributeEntry, SequenceEntry, ConfigurationEntry):
         the number of processors assigned to this model
         """
 
-        return self.__processors
+        return self._processors
 
     @processors.setter
     def processors(self, processors: int):
@@ -238,7 +318,8 @@ class ModelEntry(AttributeEntry, SequenceEntry, ConfigurationEntry):
         """
 
         if processors != self.processors:
-            self.__processors = processors
+            self._processors = processors
+            self._string = None
             # update following processors
             self.start_processor = self.start_processor
 
@@ -248,7 +329,7 @@ class ModelEntry(AttributeEntry, SequenceEntry, ConfigurationEntry):
         the first index in the processor series assigned to this model
         """
 
-        return self.__start_processor
+        return self._start_processor
 
     @start_processor.setter
     def start_processor(self, index: int):
@@ -256,11 +337,19 @@ class ModelEntry(AttributeEntry, SequenceEntry, ConfigurationEntry):
         set the first index in the processor series (this also updates all subsequent entries in the run sequence)
         """
 
-        self.__start_processor = index
+        self._start_processor = index
+        self._string = None
+
+        # offset the following entries by a running sum of processors,
+        # in a single pass down the sequence
+        if index is not None:
+            index += self.processors
         current_model = self.next
         while current_model is not None:
-            if current_model.previous is not None:
-                current_model.__start_processor = current_model.previous.end_processor + 1
+            current_model._start_processor = index
+            current_model._string = None
+            if index is not None:
+                index += current_model.processors
             current_model = current_model.next
 
     @property
@@ -280,7 +369,7 @@ class ModelEntry(AttributeEntry, SequenceEntry, ConfigurationEntry):
         the previous entry in the run sequence
         """
 
-        return self.__previous
+        return self._previous
 
     @previous.setter
     def previous(self, previous: 'ModelEntry'):
@@ -289,10 +378,10 @@ class ModelEntry(AttributeEntry, SequenceEntry, ConfigurationEntry):
         """
 
         if previous is None and self.previous is not None:
-            self.previous.__next = None
-        self.__previous = previous
+            self.previous._next = None
+        self._previous = previous
         if self.previous is not None:
-            self.previous.__next = self
+            self.previous._next = self
             if self.previous.end_processor is not None:
                 self.start_processor = self.previous.end_processor + 1
         else:
@@ -304,7 +393,7 @@ class ModelEntry(AttributeEntry, SequenceEntry, ConfigurationEntry):
         the next entry in the run sequence
         """
 
-        return self.__next
+        return self._next
 
     @next.setter
     def next(self, next: 'ModelEntry'):
@@ -313,33 +402,34 @@ class ModelEntry(AttributeEntry, SequenceEntry, ConfigurationEntry):
         """
 
         if next is None and self.next is not None:
-            self.next.__previous = None
-        self.__next = next
+            self.next._previous = None
+        self._next = next
         if self.next is not None:
-            self.next.__previous = self
+            self.next._previous = self
 
     @property
     def sequence_entry(self) -> str:
         return str(self.entry_type.value)
 
     def __str__(self) -> str:
-        return '\n'.join(
-            [
-                f'{self.entry_type.value}_model:                      {self.name}',
-                f'{self.entry_type.value}_petlist_bounds:             {self.start_processor} {self.end_processor}',
-                f'{self.entry_type.value}_attributes::',
-                indent(
-                    '\n'.join(
-                        [
-                            f'{attribute} = {value}'
-                            for attribute, value in self.attributes.items()
-                        ]
+        # the serialized entry is cached until the attributes or processor assignment change,
+        # and is keyed on the type and name, which can be reassigned on an instance
+        key = (self.entry_type, self.name)
+        if self._string is None or self._string_key != key:
+            self._string_key = key
+            self._string = MODEL_ENTRY_TEMPLATE.format_map(
+                {
+                    'type': self.entry_type.value,
+                    'name': self.name,
+                    'start': self.start_processor,
+                    'end': self.end_processor,
+                    'attributes': '\n'.join(
+                        f'{INDENTATION}{attribute} = {value}'
+                        for attribute, value in self.attributes.items()
                     ),
-                    INDENTATION,
-                ),
-                '::',
-            ]
-        )
+                }
+            )
+        return self._string
 
     def __eq__(self, other: 'ModelEntry') -> bool:
         return (
@@ -360,6 +450,8 @@ class ConnectionEntry(SequenceEntry, ConfigurationEntry):
     a connection entry in ``nems.configure`` representing a simple coupling between two model entries
     """
 
+    __slots__ = ('__source', '__target', '__method', '__models', '__sequence_entry')
+
     def __init__(self, source: ModelEntry, target: ModelEntry, method: GridRemapMethod = None):
         """
         :param source: source model entry
@@ -367,24 +459,22 @@ class ConnectionEntry(SequenceEntry, ConfigurationEntry):
         :param method: remapping method with which to translate between differing grids (use ``redist`` for the same grid)
         """
 
+        self.__models = None
+        self.__sequence_entry = None
+
         self.source = source
         self.target = target
         self.method = method if method is not None else GridRemapMethod.BILINEAR
 
     @classmethod
     def from_string(cls, string: str, **kwargs) -> 'ConnectionEntry':
-        method = None
-        try:
-            source, target = (entry.strip() for entry in string.split('->', 1))
-        except ValueError:
+        match = CONNECTION_PATTERN.match(string)
+        if match is None:
             raise ValueError(
                 'connection entry should be formatted as `SRC -> DST   :remapMethod=METHOD`'
             )
-
-        if ':' in target:
-            target, parsed_method = (entry.strip() for entry in target.split(':', 1))
-            if method is None and len(parsed_method) > 0:
-                method = GridRemapMethod(parsed_method.split('=')[-1])
+        source, target, method = match.groups()
+        method = GridRemapMethod(method) if method else None
 
         source_model = ModelEntry(None)
         target_model = ModelEntry(None)
@@ -399,20 +489,65 @@ class ConnectionEntry(SequenceEntry, ConfigurationEntry):
     def __copy__(self) -> 'ConnectionEntry':
         return self.__class__(source=self.source, target=self.target, method=self.method)
 
+    @property
+    def source(self) -> ModelEntry:
+        """
+        the model providing information to the coupling
+        """
+
+        return self.__source
+
+    @source.setter
+    def source(self, source: ModelEntry):
+        self.__source = source
+        self.__models = None
+        self.__sequence_entry = None
+
+    @property
+    def target(self) -> ModelEntry:
+        """
+        the model receiving information from the coupling
+        """
+
+        return self.__target
+
+    @target.setter
+    def target(self, target: ModelEntry):
+        self.__target = target
+        self.__models = None
+        self.__sequence_entry = None
+
+    @property
+    def method(self) -> GridRemapMethod:
+        """
+        the remapping method of the coupling
+        """
+
+        return self.__method
+
+    @method.setter
+    def method(self, method: GridRemapMethod):
+        self.__method = method
+        self.__sequence_entry = None
+
     @property
     def models(self) -> List[ModelEntry]:
         """
         the source and target models in the coupling
         """
 
-        return [self.source, self.target]
+        if self.__models is None:
+            self.__models = [self.source, self.target]
+        return self.__models
 
     @property
     def sequence_entry(self) -> str:
-        return (
-            f'{self.source.entry_type.value} -> {self.target.entry_type.value}'.ljust(13)
-            + f':remapMethod={self.method.value}'
-        )
+        if self.__sequence_entry is None:
+            self.__sequence_entry = CONNECTION_ENTRY_TEMPLATE.format(
+                connection=f'{self.source.entry_type.value} -> {self.target.entry_type.value}',
+                method=self.method.value,
+            )
+        return self.__sequence_entry
 
     def __eq__(self, other: 'ConnectionEntry') -> bool:
         return (
@@ -449,6 +584,8 @@ class MediationFunctionEntry(SequenceEntry, ConfigurationEntry):
     the dedicated function of a mediation entry, applied to the coupling between two model entries in ``nems.configure``
     """
 
+    __slots__ = ('name', 'mediator')
+
     def __init__(self, name: str, mediator: MediatorEntry):
         """
         :param name: name of function
@@ -490,6 +627,18 @@ class MediationEntry(SequenceEntry, ConfigurationEntry):
     an application of a mediator between model entries, with a dedicated coupling function
     """
 
+    __slots__ = (
+        '__mediator',
+        '__functions',
+        '__sources',
+        '__targets',
+        '__method',
+        '__source_connections',
+        '__target_connections',
+        '__models',
+        '__sequence_entry',
+    )
+
     def __init__(
         self,
         mediator: MediatorEntry,
@@ -511,6 +660,11 @@ class MediationEntry(SequenceEntry, ConfigurationEntry):
         if functions is None:
             functions = []
 
+        self.__source_connections = None
+        self.__target_connections = None
+        self.__models = None
+        self.__sequence_entry = None
+
         self.mediator = mediator
         self.functions = [
             MediationFunctionEntry(mediation_function, self.mediator)
@@ -530,19 +684,7 @@ class MediationEntry(SequenceEntry, ConfigurationEntry):
         for line in lines:
             if len(line) > 0:
                 if '->' in line:
-                    parts = [entry.strip() for entry in line.split('->')]
-                    method = None
-                    if ':' in parts[-1]:
-                        parts[-1], method = [
-                            entry.strip() for entry in parts[-1].split(':remapMethod=')
-                        ]
-                    if len(parts) == 2:
-                        connection = ConnectionEntry.from_string(line)
-                    else:
-                        connection = ConnectionEntry(
-                            source=parts[0], target=parts[-1], method=method
-                        )
-                    connections.append(connection)
+                    connections.append(ConnectionEntry.from_string(line))
                 else:
                     functions.append(MediationFunctionEntry.from_string(line))
 
@@ -581,17 +723,86 @@ class MediationEntry(SequenceEntry, ConfigurationEntry):
             method=self.method,
         )
 
+    @property
+    def mediator(self) -> MediatorEntry:
+        """
+        mediator entry hosting this mediation
+        """
+
+        return self.__mediator
+
+    @mediator.setter
+    def mediator(self, mediator: MediatorEntry):
+        self.__mediator = mediator
+        self.__reset()
+
+    @property
+    def functions(self) -> Tuple[MediationFunctionEntry, ...]:
+        """
+        mediation functions applied by the mediator
+        """
+
+        return self.__functions
+
+    @functions.setter
+    def functions(self, functions: List[MediationFunctionEntry]):
+        # store a tuple, so that the cached sequence entry cannot go stale through in-place changes
+        self.__functions = tuple(functions)
+        self.__sequence_entry = None
+
+    @property
+    def sources(self) -> Tuple[ModelEntry, ...]:
+        """
+        source models
+        """
+
+        return self.__sources
+
+    @sources.setter
+    def sources(self, sources: List[ModelEntry]):
+        # store a tuple, so that the cached connections cannot go stale through in-place changes
+        self.__sources = tuple(sources) if sources is not None else None
+        self.__reset()
+
+    @property
+    def targets(self) -> Tuple[ModelEntry, ...]:
+        """
+        target models
+        """
+
+        return self.__targets
+
+    @targets.setter
+    def targets(self, targets: List[ModelEntry]):
+        # store a tuple, so that the cached connections cannot go stale through in-place changes
+        self.__targets = tuple(targets) if targets is not None else None
+        self.__reset()
+
+    @property
+    def method(self) -> GridRemapMethod:
+        """
+        remapping method of the connections to and from the mediator
+        """
+
+        return self.__method
+
+    @method.setter
+    def method(self, method: GridRemapMethod):
+        self.__method = method
+        self.__reset()
+
     @property
     def source_connections(self) -> List[ConnectionEntry]:
         """
         list of connections between the source(s) and the mediator
         """
 
-        source_connections = []
-        if self.sources is not None:
-            for index, source in enumerate(self.sources):
-                source_connections.append(ConnectionEntry(source, self.mediator, self.method))
-        return source_connections
+        if self.__source_connections is None:
+            self.__source_connections = [
+                ConnectionEntry(source, self.mediator, self.method)
+                for source in (self.sources if self.sources is not None else [])
+            ]
+        return self.__source_connections
 
     @property
     def target_connections(self) -> List[ConnectionEntry]:
@@ -599,11 +810,12 @@ class MediationEntry(SequenceEntry, ConfigurationEntry):
         list of connections between the mediator and the target(s)
         """
 
-        target_connections = []
-        if self.targets is not None:
-            for index, target in enumerate(self.targets):
-                target_connections.append(ConnectionEntry(self.mediator, target, self.method))
-        return target_connections
+        if self.__target_connections is None:
+            self.__target_connections = [
+                ConnectionEntry(self.mediator, target, self.method)
+                for target in (self.targets if self.targets is not None else [])
+            ]
+        return self.__target_connections
 
     @property
     def models(self) -> List[ModelEntry]:
@@ -611,27 +823,44 @@ class MediationEntry(SequenceEntry, ConfigurationEntry):
         list of model entries involved in the mediation
         """
 
-        return [
-            *(connection.source for connection in self.source_connections),
-            self.mediator,
-            *(connection.target for connection in self.target_connections),
-        ]
+        if self.__models is None:
+            self.__models = [
+                *(connection.source for connection in self.source_connections),
+                self.mediator,
+                *(connection.target for connection in self.target_connections),
+            ]
+        return self.__models
 
     @property
     def sequence_entry(self) -> str:
-        return '\n'.join(
-            (
-                *(
-                    source_connection.sequence_entry
-                    for source_connection in self.source_connections
-                ),
-                *(mediation_function.sequence_entry for mediation_function in self.functions),
-                *(
-                    target_connection.sequence_entry
-                    for target_connection in self.target_connections
-                ),
+        if self.__sequence_entry is None:
+            self.__sequence_entry = '\n'.join(
+                (
+                    *(
+                        source_connection.sequence_entry
+                        for source_connection in self.source_connections
+                    ),
+                    *(
+                        mediation_function.sequence_entry
+                        for mediation_function in self.functions
+                    ),
+                    *(
+                        target_connection.sequence_entry
+                        for target_connection in self.target_connections
+                    ),
+                )
             )
-        )
+        return self.__sequence_entry
+
+    def __reset(self):
+        """
+        discard connections, models, and sequence entry built from previous sources, targets, mediator, or method
+        """
+
+        self.__source_connections = None
+        self.__target_connections = None
+        self.__models = None
+        self.__sequence_entry = None
 
     def __eq__(self, other: 'MediationEntry') -> bool:
         return (
@@ -8,9 +8,6 @@ class HydrologicalModelEntry(ModelEntry):
 
     entry_type = EntryType.HYDROLOGICAL
 
-    def __init__(self, processors: int, **kwargs):
-        super().__init__(processors, **kwargs)
-
 
 class NationalWaterModelEntry(HydrologicalModelEntry):
     """
@@ -19,6 +16,3 @@ class NationalWaterModelEntry(HydrologicalModelEntry):
     """
 
     name = 'nwm'
-
-    def __init__(self, processors: int, **kwargs):
-        super().__init__(processors, **kwargs)
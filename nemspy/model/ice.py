@@ -10,9 +10,6 @@ class IceModelEntry(ModelEntry):
 
     entry_type = EntryType.ICE
 
-    def __init__(self, processors: int, **kwargs):
-        super().__init__(processors, **kwargs)
-
 
 class IceForcingEntry(IceModelEntry, FileForcingEntry):
     """
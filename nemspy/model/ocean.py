@@ -8,9 +8,6 @@ class OceanModelEntry(ModelEntry):
 
     entry_type = EntryType.OCEAN
 
-    def __init__(self, processors: int, **kwargs):
-        super().__init__(processors, **kwargs)
-
 
 class ADCIRCEntry(OceanModelEntry):
     """
@@ -22,9 +19,6 @@ class ADCIRCEntry(OceanModelEntry):
 
     name = 'adcirc'
 
-    def __init__(self, processors: int, **kwargs):
-        super().__init__(processors, **kwargs)
-
 
 class SCHISMEntry(OceanModelEntry):
     """
@@ -33,6 +27,3 @@ class SCHISMEntry(OceanModelEntry):
     """
 
     name = 'schism'
-
-    def __init__(self, processors: int, **kwargs):
-        super().__init__(processors, **kwargs)
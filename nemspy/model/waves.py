@@ -10,9 +10,6 @@ class WaveModelEntry(ModelEntry):
 
     entry_type = EntryType.WAVE
 
-    def __init__(self, processors: int, **kwargs):
-        super().__init__(processors, **kwargs)
-
 
 class WaveWatch3ForcingEntry(WaveModelEntry, FileForcingEntry):
     """
@@ -39,9 +36,6 @@ class WaveWatch3Entry(WaveModelEntry):
 
     name = 'ww3'
 
-    def __init__(self, processors: int, **kwargs):
-        super().__init__(processors, **kwargs)
-
 
 class SWANEntry(WaveModelEntry):
     """
@@ -50,6 +44,3 @@ class SWANEntry(WaveModelEntry):
     """
 
     name = 'swan'
-
-    def __init__(self, processors: int, **kwargs):
-        super().__init__(processors, **kwargs)
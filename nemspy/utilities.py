@@ -1,7 +1,6 @@
 import logging
 import os
 from os import PathLike
-from pathlib import Path
 import shutil
 import warnings
 
@@ -10,39 +9,39 @@ def create_symlink(
     source_filename: PathLike, symlink_filename: PathLike, relative: bool = False
 ):
     """
+    if a symbolic link cannot be created, falls back to a hard link, then to a copy of the file
+
     :param source_filename: path to point to
     :param symlink_filename: path at which to create symlink
     :param relative: make symlink relative to source location
     """
 
-    if not isinstance(source_filename, Path):
-        source_filename = Path(source_filename)
-    if not isinstance(symlink_filename, Path):
-        symlink_filename = Path(symlink_filename)
-
-    if symlink_filename.is_symlink():
+    if os.path.islink(symlink_filename):
         logging.debug(f'removing symlink "{symlink_filename}"')
         os.remove(symlink_filename)
-    symlink_filename = symlink_filename.parent.absolute().resolve() / symlink_filename.name
+    symlink_filename = os.path.abspath(symlink_filename)
+    source_filename = os.path.abspath(source_filename)
+    link_target = source_filename
 
-    starting_directory = None
     if relative:
-        starting_directory = Path().cwd().resolve()
-        os.chdir(symlink_filename.parent)
-        if source_filename.is_absolute():
-            try:
-                source_filename = source_filename.relative_to(symlink_filename.parent)
-            except ValueError as error:
-                warnings.warn(error)
-                os.chdir(starting_directory)
-    else:
-        source_filename = source_filename.absolute()
+        try:
+            source_filename = os.path.relpath(
+                source_filename, os.path.dirname(symlink_filename)
+            )
+        except ValueError as error:
+            warnings.warn(error)
 
     try:
-        symlink_filename.symlink_to(source_filename)
+        os.symlink(source_filename, symlink_filename)
     except Exception as error:
         warnings.warn(f'could not create symbolic link: {error}')
-        shutil.copyfile(source_filename, symlink_filename)
-
-    if starting_directory is not None:
-        os.chdir(starting_directory)
+        if os.path.lexists(symlink_filename):
+            if os.path.samefile(link_target, symlink_filename):
+                # already linked, e.g. by the hard link of a previous write
+                return
+            logging.debug(f'removing file "{symlink_filename}"')
+            os.remove(symlink_filename)
+        try:
+            os.link(link_target, symlink_filename)
+        except OSError:
+            shutil.copyfile(link_target, symlink_filename)
@@ -1,3 +1,4 @@
+from io import StringIO
 import os
 from os import PathLike
 from pathlib import Path
@@ -5,7 +6,6 @@ import re
 
 DATA_DIRECTORY = Path(__file__).parent / 'data'
 INPUT_DIRECTORY = DATA_DIRECTORY / 'input'
-OUTPUT_DIRECTORY = DATA_DIRECTORY / 'output'
 REFERENCE_DIRECTORY = DATA_DIRECTORY / 'reference'
 
 
@@ -27,27 +27,36 @@ def check_reference_directory(
         else:
             test_filename = test_directory / reference_filename.name
 
-            with open(test_filename) as test_file, open(reference_filename) as reference_file:
-                test_lines = list(test_file.readlines())
-                reference_lines = list(reference_file.readlines())
-
-                lines_to_skip = set()
-                for file_mask, line_indices in skip_lines.items():
-                    if (
-                        file_mask in str(test_filename)
-                        or re.match(file_mask, str(test_filename))
-                        and len(test_lines) > 0
-                    ):
-                        try:
-                            lines_to_skip.update(
-                                line_index % len(test_lines) for line_index in line_indices
-                            )
-                        except ZeroDivisionError:
-                            continue
-
-                for line_index in sorted(lines_to_skip, reverse=True):
+            lines_to_skip = set()
+            for file_mask, line_indices in skip_lines.items():
+                if file_mask in str(test_filename) or re.match(file_mask, str(test_filename)):
+                    lines_to_skip.update(line_indices)
+
+            with open(test_filename, 'rb') as test_file:
+                test_bytes = test_file.read()
+            with open(reference_filename, 'rb') as reference_file:
+                reference_bytes = reference_file.read()
+
+            # when skipping at most the header line, compare the remaining bytes directly
+            if lines_to_skip <= {0}:
+                if len(lines_to_skip) > 0 and len(test_bytes) > 0:
+                    test_bytes = test_bytes.partition(b'\n')[2]
+                    reference_bytes = reference_bytes.partition(b'\n')[2]
+                if test_bytes == reference_bytes:
+                    continue
+
+            # otherwise, compare line by line (also normalizing line endings)
+            test_lines = StringIO(test_bytes.decode(), newline=None).readlines()
+            reference_lines = StringIO(reference_bytes.decode(), newline=None).readlines()
+
+            if len(test_lines) > 0:
+                # resolve negative indices, and delete from the end so that the indices stay valid
+                skipped = {line_index % len(test_lines) for line_index in lines_to_skip}
+                for line_index in sorted(skipped, reverse=True):
                     del test_lines[line_index], reference_lines[line_index]
 
-                cwd = Path.cwd()
-                message = f'"{os.path.relpath(test_filename, cwd)}" != "{os.path.relpath(reference_filename, cwd)}"'
-                assert '\n'.join(test_lines) == '\n'.join(reference_lines), message
+            # the failure message is only formatted if the assertion fails
+            assert test_lines == reference_lines, (
+                f'"{os.path.relpath(test_filename, Path.cwd())}" != '
+                f'"{os.path.relpath(reference_filename, Path.cwd())}"'
+            )
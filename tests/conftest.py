@@ -0,0 +1,75 @@
+from datetime import datetime, timedelta
+import os
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+from nemspy import ModelingSystem
+from nemspy.model import (
+    ADCIRCEntry,
+    AtmosphericForcingEntry,
+    IceForcingEntry,
+    NationalWaterModelEntry,
+    WaveWatch3ForcingEntry,
+)
+from nemspy.model.base import VerbosityOption
+from tests import INPUT_DIRECTORY
+
+
+@pytest.fixture(scope='session')
+def start_time() -> datetime:
+    return datetime(2020, 6, 1)
+
+
+@pytest.fixture(scope='session')
+def duration() -> timedelta:
+    return timedelta(days=1)
+
+
+@pytest.fixture(scope='session')
+def interval() -> timedelta:
+    return timedelta(hours=1)
+
+
+@pytest.fixture(scope='session')
+def forcings_directory() -> Path:
+    return Path(os.path.relpath(INPUT_DIRECTORY / 'forcings', Path(__file__).parent))
+
+
+@pytest.fixture
+def make_nems(
+    start_time: datetime, duration: timedelta, interval: timedelta
+) -> Callable[..., ModelingSystem]:
+    def make(**kwargs) -> ModelingSystem:
+        return ModelingSystem(start_time, start_time + duration, interval, **kwargs)
+
+    return make
+
+
+# model entries are function-scoped, since a modeling system assigns their processors
+
+
+@pytest.fixture
+def atmospheric_mesh(forcings_directory: Path) -> AtmosphericForcingEntry:
+    return AtmosphericForcingEntry(forcings_directory / 'wind_atm_fin_ch_time_vec.nc')
+
+
+@pytest.fixture
+def ice_mesh(forcings_directory: Path) -> IceForcingEntry:
+    return IceForcingEntry(forcings_directory / 'sea_ice.nc')
+
+
+@pytest.fixture
+def wave_mesh(forcings_directory: Path) -> WaveWatch3ForcingEntry:
+    return WaveWatch3ForcingEntry(forcings_directory / 'ww3.Constant.20151214_sxy_ike_date.nc')
+
+
+@pytest.fixture
+def ocean_model() -> ADCIRCEntry:
+    return ADCIRCEntry(11)
+
+
+@pytest.fixture
+def hydrological_model() -> NationalWaterModelEntry:
+    return NationalWaterModelEntry(769, Verbosity=VerbosityOption.MAX)
@@ -1,51 +1,55 @@
 #!/usr/bin/env python
 # flake8: noqa
 
-from datetime import datetime, timedelta
-import os
-from pathlib import Path
+from datetime import timedelta
+from io import StringIO
+from typing import Dict
 
 import pytest
 
-from nemspy import ModelingSystem
-from nemspy.model import (
-    ADCIRCEntry,
-    AtmosphericForcingEntry,
-    IceForcingEntry,
-    NationalWaterModelEntry,
-    WaveWatch3ForcingEntry,
+from nemspy.configuration import (
+    FileForcingsFile,
+    ModelConfigurationFile,
+    NEMSConfigurationFile,
+    RunSequence,
 )
-from nemspy.model.base import ConnectionEntry, VerbosityOption
-from tests import (
-    check_reference_directory,
-    INPUT_DIRECTORY,
-    OUTPUT_DIRECTORY,
-    REFERENCE_DIRECTORY,
+from nemspy.model import WaveWatch3ForcingEntry
+from nemspy.model.base import ConnectionEntry, EntryType, ModelEntry, VerbosityOption
+from tests import check_reference_directory, REFERENCE_DIRECTORY
+
+EXPECTED_CONNECTIONS = (
+    'WAV -> OCN   :remapMethod=redist',
+    'OCN -> WAV   :remapMethod=redist',
+)
+EXPECTED_MEDIATIONS = (
+    'ATM -> MED   :remapMethod=bilinear\n'
+    'MED MedPhase_prep_ice\n'
+    'MED -> ICE   :remapMethod=bilinear',
+    'ICE -> MED   :remapMethod=bilinear\n'
+    'MED MedPhase_atm_ocn_flux\n'
+    'MED MedPhase_accum_fast\n'
+    'MED MedPhase_prep_ocn\n'
+    'MED -> OCN   :remapMethod=bilinear',
+)
+REFERENCE_CONNECTIONS = (
+    ('ATM', 'OCN'),
+    ('WAV', 'OCN'),
+    ('ATM', 'HYD'),
+    ('WAV', 'HYD'),
+    ('OCN', 'HYD'),
 )
 
-FORCINGS_DIRECTORY = Path(os.path.relpath(INPUT_DIRECTORY / 'forcings', Path(__file__).parent))
-ATMOSPHERIC_MESH_FILENAME = FORCINGS_DIRECTORY / 'wind_atm_fin_ch_time_vec.nc'
-ICE_MESH_FILENAME = FORCINGS_DIRECTORY / 'sea_ice.nc'
-WAVE_MESH_FILENAME = FORCINGS_DIRECTORY / 'ww3.Constant.20151214_sxy_ike_date.nc'
-
-
-def test_interface():
-    start_time = datetime(2020, 6, 1)
-    duration = timedelta(days=1)
-    interval = timedelta(hours=1)
-    atmospheric_mesh = AtmosphericForcingEntry(ATMOSPHERIC_MESH_FILENAME)
-    wave_mesh = WaveWatch3ForcingEntry(WAVE_MESH_FILENAME)
-    ocean_model = ADCIRCEntry(11)
-    hydrological_model = NationalWaterModelEntry(769, Verbosity=VerbosityOption.MAX)
-
-    nems = ModelingSystem(
-        start_time,
-        start_time + duration,
-        interval,
-        atm=atmospheric_mesh,
-        wav=wave_mesh,
-        ocn=ocean_model,
-    )
+
+def test_interface(
+    make_nems,
+    start_time,
+    interval,
+    atmospheric_mesh,
+    wave_mesh,
+    ocean_model,
+    hydrological_model,
+):
+    nems = make_nems(atm=atmospheric_mesh, wav=wave_mesh, ocn=ocean_model)
 
     assert nems['ATM'] is atmospheric_mesh
     assert nems['WAV'] is wave_mesh
@@ -59,6 +63,8 @@ def test_interface():
     nems['HYD'] = hydrological_model
 
     assert nems['HYD'] is hydrological_model
+    assert 'hyd' in nems
+    assert 'nonexistent' not in nems
 
     assert nems.interval == interval
     assert nems.attributes['Verbosity'] == 'off'
@@ -73,36 +79,22 @@ def test_interface():
 
     assert nems.attributes['Verbosity'] == 'max'
 
+    assert 'nhours_fcst:             24' in nems.configuration['model_configure']
 
-def test_connection():
-    start_time = datetime(2020, 6, 1)
-    duration = timedelta(days=1)
-    interval = timedelta(hours=1)
-    ocean_model = ADCIRCEntry(11)
-    wave_mesh = WaveWatch3ForcingEntry(WAVE_MESH_FILENAME)
+    nems.end_time = start_time + timedelta(days=2)
 
-    nems = ModelingSystem(
-        start_time, start_time + duration, interval, ocn=ocean_model, wav=wave_mesh
-    )
+    assert 'nhours_fcst:             48' in nems.configuration['model_configure']
+
+
+def test_connection(make_nems, wave_mesh, ocean_model):
+    nems = make_nems(ocn=ocean_model, wav=wave_mesh)
     nems.connect('WAV', 'OCN')
     nems.connect('OCN -> WAV')
 
     connection_1 = ConnectionEntry.from_string('ATM -> OCN   :remapMethod=bilinear')
     connection_2 = ConnectionEntry.from_string('ATM ->OCN :remapMethod=nearest_stod')
 
-    with pytest.raises(KeyError):
-        nems.connect('ATM', 'OCN')
-    with pytest.raises(KeyError):
-        nems.connect('WAV', 'HYD')
-    with pytest.raises(KeyError):
-        nems.connect('WAV', 'nonexistent')
-    with pytest.raises(KeyError):
-        nems.connect('WAV', 'OCN', 'nonexistent')
-
-    assert nems.connections == [
-        'WAV -> OCN   :remapMethod=redist',
-        'OCN -> WAV   :remapMethod=redist',
-    ]
+    assert nems.connections == list(EXPECTED_CONNECTIONS)
 
     assert connection_1.source.name == 'ATM'
     assert connection_1.target.name == 'OCN'
@@ -112,22 +104,19 @@ def test_connection():
     assert connection_2.method.name == 'NEAREST_STOD'
 
 
-def test_mediation():
-    start_time = datetime(2020, 6, 1)
-    duration = timedelta(days=1)
-    interval = timedelta(hours=1)
-    atmospheric_mesh = AtmosphericForcingEntry(ATMOSPHERIC_MESH_FILENAME)
-    ice_mesh = IceForcingEntry(ICE_MESH_FILENAME)
-    ocean_model = ADCIRCEntry(11)
-
-    nems = ModelingSystem(
-        start_time,
-        start_time + duration,
-        interval,
-        ice=ice_mesh,
-        ocn=ocean_model,
-        atm=atmospheric_mesh,
-    )
+@pytest.mark.parametrize(
+    'arguments',
+    [('ATM', 'OCN'), ('WAV', 'HYD'), ('WAV', 'nonexistent'), ('WAV', 'OCN', 'nonexistent')],
+)
+def test_invalid_connection(make_nems, wave_mesh, ocean_model, arguments):
+    nems = make_nems(ocn=ocean_model, wav=wave_mesh)
+
+    with pytest.raises(KeyError):
+        nems.connect(*arguments)
+
+
+def test_mediation(make_nems, atmospheric_mesh, ice_mesh, ocean_model):
+    nems = make_nems(ice=ice_mesh, ocn=ocean_model, atm=atmospheric_mesh)
 
     nems.connect('OCN', 'MED')
     nems.mediate(
@@ -154,34 +143,11 @@ def test_mediation():
     with pytest.raises(KeyError):
         nems.connect('WAV', 'OCN', 'nonexistent')
 
-    assert nems.connections == [
-        'ATM -> MED   :remapMethod=bilinear\n'
-        'MED MedPhase_prep_ice\n'
-        'MED -> ICE   :remapMethod=bilinear',
-        'ICE -> MED   :remapMethod=bilinear\n'
-        'MED MedPhase_atm_ocn_flux\n'
-        'MED MedPhase_accum_fast\n'
-        'MED MedPhase_prep_ocn\n'
-        'MED -> OCN   :remapMethod=bilinear',
-    ]
+    assert nems.connections == list(EXPECTED_MEDIATIONS)
 
 
-def test_sequence():
-    start_time = datetime(2020, 6, 1)
-    duration = timedelta(days=1)
-    interval = timedelta(hours=1)
-    atmospheric_mesh = AtmosphericForcingEntry(ATMOSPHERIC_MESH_FILENAME)
-    wave_mesh = WaveWatch3ForcingEntry(WAVE_MESH_FILENAME)
-    ocean_model = ADCIRCEntry(11)
-
-    nems = ModelingSystem(
-        start_time,
-        start_time + duration,
-        interval,
-        atm=atmospheric_mesh,
-        wav=wave_mesh,
-        ocn=ocean_model,
-    )
+def test_sequence(make_nems, atmospheric_mesh, wave_mesh, ocean_model):
+    nems = make_nems(atm=atmospheric_mesh, wav=wave_mesh, ocn=ocean_model)
 
     assert atmospheric_mesh.start_processor == 0
     assert atmospheric_mesh.end_processor == 0
@@ -234,50 +200,73 @@ def test_sequence():
     assert ocean_model.end_processor == 12
 
 
-def test_configuration_files():
-    output_directory = OUTPUT_DIRECTORY / 'test_configuration_files'
-    reference_directory = REFERENCE_DIRECTORY / 'test_configuration_files'
+@pytest.fixture
+def reference_models(
+    forcings_directory, atmospheric_mesh, ocean_model, hydrological_model
+) -> Dict[str, ModelEntry]:
+    """
+    models of the configuration in ``tests/data/reference/test_configuration_files``
+    """
 
-    start_time = datetime(2020, 6, 1)
-    duration = timedelta(days=1)
-    interval = timedelta(hours=1)
-    atmospheric_mesh = AtmosphericForcingEntry(ATMOSPHERIC_MESH_FILENAME)
-    wave_mesh = WaveWatch3ForcingEntry(WAVE_MESH_FILENAME, Verbosity='low')
-    ocean_model = ADCIRCEntry(11)
-    hydrological_model = NationalWaterModelEntry(769, Verbosity=VerbosityOption.MAX)
-
-    nems = ModelingSystem(
-        start_time,
-        start_time + duration,
-        interval,
-        atm=atmospheric_mesh,
-        wav=wave_mesh,
-        ocn=ocean_model,
-        hyd=hydrological_model,
-        Verbosity='off',
+    wave_mesh = WaveWatch3ForcingEntry(
+        forcings_directory / 'ww3.Constant.20151214_sxy_ike_date.nc', Verbosity='low'
     )
-    nems.connect('ATM', 'OCN')
-    nems.connect('WAV', 'OCN')
-    nems.connect('ATM', 'HYD')
-    nems.connect('WAV', 'HYD')
-    nems.connect('OCN', 'HYD')
+    return {
+        'atm': atmospheric_mesh,
+        'wav': wave_mesh,
+        'ocn': ocean_model,
+        'hyd': hydrological_model,
+    }
 
-    sequence = [
-        'ATM -> OCN',
-        'WAV -> OCN',
-        'ATM -> HYD',
-        'WAV -> HYD',
-        'OCN -> HYD',
-        'ATM',
-        'WAV',
-        'OCN',
-        'HYD',
-    ]
 
-    nems.sequence = sequence
+@pytest.mark.io
+def test_configuration_files(tmp_path, make_nems, reference_models):
+    output_directory = tmp_path / 'test_configuration_files'
+    reference_directory = REFERENCE_DIRECTORY / 'test_configuration_files'
+
+    nems = make_nems(**reference_models, Verbosity='off')
+    for source, target in REFERENCE_CONNECTIONS:
+        nems.connect(source, target)
+    nems.sequence = [
+        *(f'{source} -> {target}' for source, target in REFERENCE_CONNECTIONS),
+        *(model_type.upper() for model_type in reference_models),
+    ]
 
     nems.write(output_directory, overwrite=True, include_version=True)
 
     assert nems.processors == 782
 
     check_reference_directory(output_directory, reference_directory, skip_lines={'.*': [0]})
+
+
+def test_configuration_file_objects(
+    tmp_path, monkeypatch, start_time, duration, interval, reference_models
+):
+    reference_directory = REFERENCE_DIRECTORY / 'test_configuration_files'
+
+    sequence = RunSequence(interval, **reference_models, Verbosity='off')
+    for source, target in REFERENCE_CONNECTIONS:
+        sequence.connect(EntryType(source), EntryType(target))
+    sequence.sequence = [*sequence.connections, *reference_models.values()]
+
+    configuration_files = [
+        NEMSConfigurationFile(sequence),
+        FileForcingsFile(sequence),
+        ModelConfigurationFile(start_time, duration, sequence),
+    ]
+
+    # a link to ``model_configure`` would be created in the working directory
+    monkeypatch.chdir(tmp_path)
+
+    for configuration_file in configuration_files:
+        output = StringIO()
+
+        assert configuration_file.write(output, include_version=True) is output
+
+        with open(reference_directory / configuration_file.name) as reference_file:
+            reference = reference_file.read()
+
+        # skip the version header, as in ``check_reference_directory``
+        assert output.getvalue().partition('\n')[2] == reference.partition('\n')[2]
+
+    assert list(tmp_path.iterdir()) == []
@@ -1,39 +1,56 @@
-from copy import copy
-
-from nemspy.model import ADCIRCEntry, AtmosphericForcingEntry, WaveWatch3ForcingEntry
-from tests import INPUT_DIRECTORY
-
-ATMOSPHERIC_MESH_FILENAME = INPUT_DIRECTORY / 'wind_atm_fin_ch_time_vec.nc'
-WAVE_MESH_FILENAME = INPUT_DIRECTORY / 'ww3.Constant.20151214_sxy_ike_date.nc'
-
-
-def test_model():
+from copy import copy, deepcopy
+import pickle
+
+from nemspy.model import AtmosphericForcingEntry
+from nemspy.model.base import MediationEntry, MediatorEntry
+
+ATMOSPHERIC_MODEL_ENTRY = (
+    'ATM_model:                      atmesh\n'
+    'ATM_petlist_bounds:             0 0\n'
+    'ATM_attributes::\n'
+    '  Verbosity = off\n'
+    '  test = value\n'
+    '  test2 = 5\n'
+    '::'
+)
+UPDATED_ATMOSPHERIC_MODEL_ENTRY = (
+    'ATM_model:                      atmesh\n'
+    'ATM_petlist_bounds:             0 1\n'
+    'ATM_attributes::\n'
+    '  Verbosity = max\n'
+    '::'
+)
+
+
+def test_model(forcings_directory):
     model_1 = AtmosphericForcingEntry(
-        ATMOSPHERIC_MESH_FILENAME, Verbosity='off', test='value', test2=5,
+        forcings_directory / 'wind_atm_fin_ch_time_vec.nc',
+        Verbosity='off',
+        test='value',
+        test2=5,
     )
     model_1.start_processor = 0
 
     model_2 = copy(model_1)
     model_3 = AtmosphericForcingEntry.from_string(str(model_1))
 
-    assert (
-        str(model_1) == 'ATM_model:                      atmesh\n'
-        'ATM_petlist_bounds:             0 0\n'
-        'ATM_attributes::\n'
-        '  Verbosity = off\n'
-        '  test = value\n'
-        '  test2 = 5\n'
-        '::'
-    )
+    assert str(model_1) == ATMOSPHERIC_MODEL_ENTRY
 
     assert model_2 == model_1
     assert model_3 == model_1
 
+    model_1.processors = 2
+    attributes = {'Verbosity': 'max'}
+    model_1.attributes = attributes
+    attributes['test'] = 'value'
+
+    assert str(model_1) == UPDATED_ATMOSPHERIC_MODEL_ENTRY
 
-def test_processors():
-    model_1 = AtmosphericForcingEntry(ATMOSPHERIC_MESH_FILENAME)
-    model_2 = WaveWatch3ForcingEntry(WAVE_MESH_FILENAME)
-    model_3 = ADCIRCEntry(11)
+
+def test_processors(atmospheric_mesh, wave_mesh, ocean_model):
+    model_1 = atmospheric_mesh
+    model_2 = wave_mesh
+    model_3 = ocean_model
 
     model_1.next = model_2
     model_2.next = model_3
@@ -66,16 +83,7 @@ def test_processors():
 
 
 def test_from_string():
-    model = AtmosphericForcingEntry.from_string(
-        'ATM_model:                      atmesh\n'
-        'ATM_petlist_bounds:             0 0\n'
-        'ATM_attributes::\n'
-        '  Verbosity = off\n'
-        '  test = value\n'
-        '  test2 = 5\n'
-        '::',
-        filename='wind.nc',
-    )
+    model = AtmosphericForcingEntry.from_string(ATMOSPHERIC_MODEL_ENTRY, filename='wind.nc')
 
     assert isinstance(model, AtmosphericForcingEntry)
 
@@ -86,3 +94,46 @@ def test_from_string():
         'test': 'value',
         'test2': '5',
     }
+
+
+def test_copy_and_pickle(ocean_model):
+    ocean_model.start_processor = 0
+    str(ocean_model)
+
+    for model in (deepcopy(ocean_model), pickle.loads(pickle.dumps(ocean_model))):
+        assert model == ocean_model
+        assert str(model) == str(ocean_model)
+
+    ocean_model.name = 'renamed'
+
+    assert str(ocean_model).startswith('OCN_model:                      renamed\n')
+
+
+def test_mediation_sources(atmospheric_mesh, ice_mesh, ocean_model):
+    sources = [atmospheric_mesh]
+    mediation = MediationEntry(
+        MediatorEntry(),
+        sources=sources,
+        functions=['MedPhase_prep_ocn'],
+        targets=[ocean_model],
+    )
+
+    assert str(mediation) == (
+        'ATM -> MED   :remapMethod=bilinear\n'
+        'MED MedPhase_prep_ocn\n'
+        'MED -> OCN   :remapMethod=bilinear'
+    )
+
+    sources.append(ice_mesh)
+
+    assert mediation.sources == (atmospheric_mesh,)
+    assert mediation.models == [atmospheric_mesh, mediation.mediator, ocean_model]
+
+    mediation.sources = [*mediation.sources, ice_mesh]
+
+    assert str(mediation) == (
+        'ATM -> MED   :remapMethod=bilinear\n'
+        'ICE -> MED   :remapMethod=bilinear\n'
+        'MED MedPhase_prep_ocn\n'
+        'MED -> OCN   :remapMethod=bilinear'
+    )
@@ -0,0 +1,38 @@
+import os
+
+import pytest
+
+from nemspy.utilities import create_symlink
+
+
+def test_create_symlink_fallback(tmp_path, monkeypatch):
+    source_filename = tmp_path / 'source.txt'
+    source_filename.write_text('test')
+
+    def fail(*args, **kwargs):
+        raise OSError('not permitted')
+
+    monkeypatch.setattr(os, 'symlink', fail)
+
+    hard_link_filename = tmp_path / 'hard_link.txt'
+    with pytest.warns(UserWarning):
+        create_symlink(source_filename, hard_link_filename)
+        create_symlink(source_filename, hard_link_filename)
+
+    assert os.path.samefile(source_filename, hard_link_filename)
+
+    with pytest.warns(UserWarning):
+        create_symlink(source_filename, source_filename)
+
+    assert source_filename.read_text() == 'test'
+
+    monkeypatch.setattr(os, 'link', fail)
+
+    copy_filename = tmp_path / 'copy.txt'
+    with pytest.warns(UserWarning):
+        create_symlink(source_filename, copy_filename)
+        source_filename.write_text('updated')
+        create_symlink(source_filename, copy_filename)
+
+    assert not os.path.samefile(source_filename, copy_filename)
+    assert copy_filename.read_text() == 'updated'